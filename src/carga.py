@@ -2,20 +2,60 @@
 
 from __future__ import annotations
 
+import copy
 import math
+import numbers
+import re
 import sqlite3
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import date, time, timedelta
+from xml.etree import ElementTree
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from logs_manage import Logs
+from logs_manage import Logs, LogsDiferido
+
+# Tipos que xlsxwriter escribe de forma nativa; el resto se exporta como texto.
+_EXCEL_SCALARS = (str, numbers.Number, date, time, timedelta)
+
+_XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_DIMENSION_RE = re.compile(rb'<dimension ref="[A-Z]+\d+(?::[A-Z]+(\d+))?"')
+_ROW_RE = re.compile(rb'<row r="(\d+)"')
 
 
 class Carga:
     """Gestiona la persistencia de los datos transformados en diferentes formatos."""
 
     MAX_EXCEL_ROWS = 1_048_576
+    SQLITE_MAX_PARAMS = 999
+    # Formato fijo de los TIMESTAMP en SQLite (el mismo que escribía to_sql)
+    SQLITE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+    # Caracteres ASCII no válidos en nombres de hoja -> "_"
+    _SANITIZE_TABLE = str.maketrans(
+        {ch: "_" for ch in map(chr, range(128)) if not (ch.isalnum() or ch in " _")}
+    )
+    # constant_memory vuelca cada fila a disco al escribirla (memoria O(1) por hoja)
+    XLSX_OPTIONS = {
+        "constant_memory": True,
+        "use_zip64": True,
+        "strings_to_formulas": False,
+        "strings_to_urls": False,
+        "nan_inf_to_errors": True,
+        "remove_timezone": True,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss",
+    }
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=OFF",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-200000",
+    )
 
     def __init__(
         self,
@@ -28,9 +68,9 @@ class Carga:
     ) -> None:
         """Configura la carga con los DataFrames y rutas de salida necesarias."""
         self.df_final = df_final
-        self.df_limpio = df_limpio
-        self.df_reviews = df_reviews
-        self.df_calendar_agregado = df_calendar_agregado
+        self.df_limpio = self._compact_dtypes(df_limpio)
+        self.df_reviews = self._compact_dtypes(df_reviews)
+        self.df_calendar_agregado = self._compact_dtypes(df_calendar_agregado)
         self.logger = (
             logger.crear_sublogger(header="LOG DE CARGA - AIRBNB CDMX")
             if logger
@@ -49,7 +89,7 @@ class Carga:
 
         self.logger.info("Clase Carga inicializada con los DataFrames a exportar")
         self.logger.info(
-            f"Formas - final: {df_final.shape}, limpio: {df_limpio.shape}, reviews: {df_reviews.shape}, calendar_agregado: {df_calendar_agregado.shape}"
+            lambda: f"Formas - final: {df_final.shape}, limpio: {df_limpio.shape}, reviews: {df_reviews.shape}, calendar_agregado: {df_calendar_agregado.shape}"
         )
         self.logger.info(f"Archivos de salida -> {self.output_dir}")
 
@@ -60,6 +100,8 @@ class Carga:
         ]
         self._expected_rows = {name: len(frame) for name, frame in self._excel_targets}
         self._excel_registry: dict[str, list[tuple[str, int]]] = {}
+        self._arrow_tables: dict = {}
+        self._parquet_registry: dict[Path, int] = {}
         self._sheet_names_in_use: set[str] = set()
 
     # -------------------------------------------------------------------------
@@ -77,12 +119,35 @@ class Carga:
         target_path.parent.mkdir(parents=True, exist_ok=True)
         return target_path
 
+    @staticmethod
+    def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """Reduce el ancho de los dtypes sin alterar los valores exportados."""
+        compacto = df.copy(deep=False)
+        for col in compacto.columns:
+            serie = compacto[col]
+            if pd.api.types.is_bool_dtype(serie.dtype):
+                continue
+            if pd.api.types.is_integer_dtype(serie.dtype):
+                compacto[col] = pd.to_numeric(serie, downcast="integer")
+            elif pd.api.types.is_float_dtype(serie.dtype):
+                reducida = pd.to_numeric(serie, downcast="float")
+                # Sólo a float32 si todos los valores se representan exactamente
+                if np.array_equal(reducida.to_numpy(), serie.to_numpy(), equal_nan=True):
+                    compacto[col] = reducida
+            elif pd.api.types.is_object_dtype(serie.dtype) or pd.api.types.is_string_dtype(serie.dtype):
+                try:
+                    unicos = serie.nunique()
+                except TypeError:  # listas u otros valores no hashables
+                    continue
+                if len(serie) and unicos / len(serie) < 0.5:
+                    compacto[col] = serie.astype("category")
+        return compacto
+
     def _unique_sheet_name(self, name: str) -> str:
         """Genera un nombre de hoja válido (<=31 caracteres) y no repetido."""
-        sanitized = "".join(ch if ch.isalnum() or ch in (" ", "_") else "_" for ch in name).strip()
+        sanitized = name.translate(self._SANITIZE_TABLE).strip()[:31]
         if not sanitized:
             sanitized = "Sheet"
-        sanitized = sanitized[:31]
 
         candidate = sanitized
         counter = 1
@@ -93,23 +158,95 @@ class Carga:
         self._sheet_names_in_use.add(candidate)
         return candidate
 
-    def _write_dataframe_to_excel(
-        self, writer: pd.ExcelWriter, df: pd.DataFrame, base_name: str
+    @staticmethod
+    def _sqlite_type(dtype) -> str:
+        """Traduce un dtype de pandas a la afinidad de columna de SQLite."""
+        if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+            return "INTEGER"
+        if pd.api.types.is_float_dtype(dtype):
+            return "REAL"
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return "TIMESTAMP"
+        return "TEXT"
+
+    @classmethod
+    def _sqlite_columns(cls, df: pd.DataFrame) -> list[list]:
+        """Convierte cada columna en una lista de valores que sqlite3 sabe enlazar."""
+        columnas = []
+        for _, serie in df.items():
+            if isinstance(serie.dtype, np.dtype) and serie.dtype.kind in "biuf":
+                columnas.append(serie.tolist())
+                continue
+            valores = (
+                serie.dt.strftime(cls.SQLITE_TIMESTAMP_FORMAT)
+                if pd.api.types.is_datetime64_any_dtype(serie.dtype)
+                else serie
+            )
+            columnas.append(valores.astype(object).where(serie.notna(), None).tolist())
+        return columnas
+
+    @classmethod
+    def _sqlite_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Prepara el DataFrame para ADBC con los mismos valores que `_sqlite_columns`."""
+        preparado = df.copy(deep=False)
+        for col, serie in df.items():
+            if pd.api.types.is_datetime64_any_dtype(serie.dtype):
+                preparado[col] = (
+                    serie.dt.strftime(cls.SQLITE_TIMESTAMP_FORMAT).astype(object).where(serie.notna(), None)
+                )
+            elif isinstance(serie.dtype, pd.CategoricalDtype):
+                preparado[col] = serie.astype(object).where(serie.notna(), None)
+        return preparado
+
+    def _create_sqlite_table(self, ejecutar) -> None:
+        """Recrea `listings_analitica` con las afinidades de `_sqlite_type`."""
+        columnas = [
+            '"{}" {}'.format(str(nombre).replace('"', '""'), self._sqlite_type(serie.dtype))
+            for nombre, serie in self.df_final.items()
+        ]
+        ejecutar("DROP TABLE IF EXISTS listings_analitica")
+        ejecutar(f"CREATE TABLE listings_analitica ({', '.join(columnas)})")
+
+    @staticmethod
+    def _excel_column(serie: pd.Series) -> np.ndarray:
+        """Devuelve la columna como arreglo de objetos aceptados por xlsxwriter."""
+        valores = serie.astype(object).where(serie.notna(), None)
+        if serie.dtype == object:
+            valores = valores.map(
+                lambda v: v if v is None or isinstance(v, _EXCEL_SCALARS) else str(v)
+            )
+        return valores.to_numpy()
+
+    @staticmethod
+    def _write_segment(
+        workbook, sheet_name: str, encabezado: list[str], columnas: list[np.ndarray], inicio: int, fin: int
     ) -> int:
+        """Escribe las filas [inicio, fin) de las columnas en una hoja nueva."""
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, encabezado)
+        filas = zip(*(columna[inicio:fin] for columna in columnas))
+        for numero, fila in enumerate(filas, start=1):
+            worksheet.write_row(numero, 0, fila)
+        return fin - inicio
+
+    def _write_dataframe_to_excel(self, workbook, df: pd.DataFrame, base_name: str) -> int:
         """Exporta un DataFrame creando varias hojas si rebasa el límite de Excel."""
         self._excel_registry[base_name] = []
+        encabezado = [str(col) for col in df.columns]
+        # Convertir cada columna una sola vez; los segmentos son vistas de estos arreglos
+        columnas = [self._excel_column(serie) for _, serie in df.items()]
 
         if df.empty:
             sheet_name = self._unique_sheet_name(f"{base_name}_sin_datos")
-            df.head(0).to_excel(writer, sheet_name=sheet_name, index=False)
+            self._write_segment(workbook, sheet_name, encabezado, columnas, 0, 0)
             self._excel_registry[base_name].append((sheet_name, 0))
             return 1
 
         total_rows = len(df)
         if total_rows <= self.MAX_EXCEL_ROWS:
             sheet_name = self._unique_sheet_name(base_name)
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-            self._excel_registry[base_name].append((sheet_name, total_rows))
+            filas = self._write_segment(workbook, sheet_name, encabezado, columnas, 0, total_rows)
+            self._excel_registry[base_name].append((sheet_name, filas))
             return 1
 
         segmentos = math.ceil(total_rows / self.MAX_EXCEL_ROWS)
@@ -119,12 +256,105 @@ class Carga:
         for idx in range(segmentos):
             inicio = idx * self.MAX_EXCEL_ROWS
             fin = min((idx + 1) * self.MAX_EXCEL_ROWS, total_rows)
-            segmento_df = df.iloc[inicio:fin]
             sheet_name = self._unique_sheet_name(f"{base_name}_{idx + 1}")
-            segmento_df.to_excel(writer, sheet_name=sheet_name, index=False)
-            self._excel_registry[base_name].append((sheet_name, len(segmento_df)))
+            filas = self._write_segment(workbook, sheet_name, encabezado, columnas, inicio, fin)
+            self._excel_registry[base_name].append((sheet_name, filas))
         return segmentos
 
+    @staticmethod
+    def _last_sheet_row(xml) -> int:
+        """Número de la última fila de una hoja, leyendo su XML en bloques."""
+        bloque = xml.read(4096)
+        match = _DIMENSION_RE.search(bloque)
+        if match:
+            return int(match.group(1) or 1)
+
+        # Sin <dimension>: buscar la última etiqueta <row> escrita
+        ultima = 0
+        previo = b""
+        while bloque:
+            datos = previo + bloque
+            pos = datos.rfind(b"<row ")
+            match = _ROW_RE.match(datos, pos) if pos != -1 else None
+            if match:
+                ultima = int(match.group(1))
+            previo = datos[-64:]
+            bloque = xml.read(1 << 20)
+        return ultima
+
+    @classmethod
+    def _xlsx_sheet_rows(cls, target_path: Path) -> dict[str, int]:
+        """Cuenta las filas de datos de cada hoja sin cargar el libro con openpyxl."""
+        with zipfile.ZipFile(target_path) as paquete:
+            libro = ElementTree.fromstring(paquete.read("xl/workbook.xml"))
+            relaciones = ElementTree.fromstring(paquete.read("xl/_rels/workbook.xml.rels"))
+            destinos = {rel.get("Id"): rel.get("Target") for rel in relaciones}
+
+            filas: dict[str, int] = {}
+            for hoja in libro.iter(f"{{{_XLSX_MAIN_NS}}}sheet"):
+                destino = destinos[hoja.get(f"{{{_XLSX_REL_NS}}}id")]
+                parte = destino[1:] if destino.startswith("/") else f"xl/{destino}"
+                with paquete.open(parte) as xml:
+                    filas[hoja.get("name")] = max(cls._last_sheet_row(xml) - 1, 0)
+        return filas
+
+    def _insert_sqlite_adbc(self, target_path: Path) -> bool:
+        """Ingresa la tabla Arrow con el driver ADBC de SQLite; False si no es posible."""
+        try:
+            import adbc_driver_sqlite.dbapi as adbc_sqlite
+        except ImportError:
+            return False
+
+        try:
+            import pyarrow as pa
+
+            # Misma DDL y mismos valores que el camino executemany: la tabla no
+            # depende de qué driver estaba disponible
+            tabla = pa.Table.from_pandas(self._sqlite_frame(self.df_final), preserve_index=False)
+            with adbc_sqlite.connect(str(target_path), autocommit=True) as conn:
+                with conn.cursor() as cursor:
+                    for pragma in self.SQLITE_PRAGMAS:
+                        cursor.execute(pragma)
+                        cursor.fetchall()
+                    self._create_sqlite_table(cursor.execute)
+                    cursor.adbc_ingest("listings_analitica", tabla, mode="append")
+            return True
+        except Exception as exc:
+            self.logger.warning(f"Ingesta ADBC no disponible ({exc}); se usará executemany")
+            return False
+
+    def _insert_sqlite_bulk(self, target_path: Path) -> None:
+        """Crea la tabla y la llena con un único executemany dentro de una transacción."""
+        marcadores = ", ".join("?" * len(self.df_final.columns))
+        with closing(sqlite3.connect(target_path, isolation_level=None)) as conn:
+            for pragma in self.SQLITE_PRAGMAS:
+                conn.execute(pragma)
+            conn.execute("BEGIN")
+            try:
+                self._create_sqlite_table(conn.execute)
+                conn.executemany(
+                    f"INSERT INTO listings_analitica VALUES ({marcadores})",
+                    zip(*self._sqlite_columns(self.df_final)),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _insert_sqlite_to_sql(self, target_path: Path) -> None:
+        """Inserta con `to_sql` usando INSERT multi-fila por lotes."""
+        chunksize = max(1, self.SQLITE_MAX_PARAMS // max(len(self.df_final.columns), 1))
+        with closing(sqlite3.connect(target_path)) as conn:
+            self.df_final.to_sql(
+                "listings_analitica",
+                conn,
+                if_exists="replace",
+                index=False,
+                method="multi",
+                chunksize=chunksize,
+            )
+            conn.commit()
+
     # -------------------------------------------------------------------------
     # Exportaciones
     # -------------------------------------------------------------------------
@@ -133,8 +363,15 @@ class Carga:
         target_path = self._resolve_output_path(db_path, self.sqlite_path)
         self.logger.nueva_entrada(f"Carga a SQLite -> {target_path}")
         try:
-            with sqlite3.connect(target_path) as conn:
-                self.df_final.to_sql("listings_analitica", conn, if_exists="replace", index=False)
+            if not self._insert_sqlite_adbc(target_path):
+                try:
+                    self._insert_sqlite_bulk(target_path)
+                except (sqlite3.InterfaceError, sqlite3.ProgrammingError) as exc:
+                    # Tipos que sqlite3 no enlaza directamente: pandas sabe adaptarlos
+                    self.logger.warning(
+                        f"Inserción masiva no disponible ({exc}); se usará to_sql por lotes"
+                    )
+                    self._insert_sqlite_to_sql(target_path)
             self.logger.info(
                 f"Éxito: {len(self.df_final)} registros insertados en 'listings_analitica'"
             )
@@ -148,9 +385,11 @@ class Carga:
         target_path = self._resolve_output_path(xlsx_path, self.xlsx_path)
         self.logger.nueva_entrada(f"Carga a XLSX -> {target_path}")
         try:
-            with pd.ExcelWriter(target_path, engine="openpyxl") as writer:
+            import xlsxwriter
+
+            with xlsxwriter.Workbook(str(target_path), self.XLSX_OPTIONS) as workbook:
                 for hoja, dataframe in self._excel_targets:
-                    segmentos = self._write_dataframe_to_excel(writer, dataframe, hoja)
+                    segmentos = self._write_dataframe_to_excel(workbook, dataframe, hoja)
                     if segmentos > 1:
                         self.logger.info(
                             f"'{hoja}' se exportó en {segmentos} hojas por límite de Excel."
@@ -164,6 +403,66 @@ class Carga:
             self.logger.error(f"Error al guardar datos en XLSX: {exc}")
             return False
 
+    def _arrow_table(self, nombre: str, df: pd.DataFrame):
+        """Convierte el DataFrame a `pyarrow.Table` una sola vez y reutiliza el resultado."""
+        tabla = self._arrow_tables.get(nombre)
+        if tabla is None:
+            import pyarrow as pa
+
+            tabla = pa.Table.from_pandas(df, preserve_index=False)
+            self._arrow_tables[nombre] = tabla
+        return tabla
+
+    def _cargar_arrow(self, formato: str, extension: str, escribir) -> bool:
+        """Convierte cada DataFrame a una tabla Arrow y la escribe con `escribir`."""
+        self.logger.nueva_entrada(f"Carga a {formato} -> {self.output_dir}")
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:  # pragma: no cover - depende de entorno
+            self.logger.warning(f"No se pudo exportar a {formato}: falta pyarrow ({exc})")
+            return False
+
+        try:
+            for nombre, dataframe in self._excel_targets:
+                target_path = self.output_dir / f"{nombre}.{extension}"
+                tabla = self._arrow_table(nombre, dataframe)
+                escribir(tabla, target_path)
+                self.logger.info(f"'{nombre}' -> {target_path.name} ({tabla.num_rows} registros)")
+            self.logger.info(
+                f"Éxito: Se guardaron {len(self._excel_targets)} archivos {formato}"
+            )
+            return True
+        except Exception as exc:  # pragma: no cover - logging de fallos
+            self.logger.error(f"Error al guardar datos en {formato}: {exc}")
+            return False
+
+    def cargar_parquet(self) -> bool:
+        """Exporta los DataFrames limpios a Parquet con compresión ZSTD."""
+
+        def escribir(tabla, target_path: Path) -> None:
+            import pyarrow.parquet as pq
+
+            pq.write_table(
+                tabla,
+                target_path,
+                compression="zstd",
+                use_dictionary=True,
+                data_page_size=1 << 20,
+            )
+            self._parquet_registry[target_path] = self._expected_rows[target_path.stem]
+
+        return self._cargar_arrow("Parquet", "parquet", escribir)
+
+    def cargar_feather(self) -> bool:
+        """Exporta los DataFrames limpios a Feather (Arrow IPC) con compresión LZ4."""
+
+        def escribir(tabla, target_path: Path) -> None:
+            import pyarrow.feather as feather
+
+            feather.write_feather(tabla, target_path, compression="lz4")
+
+        return self._cargar_arrow("Feather", "feather", escribir)
+
     # -------------------------------------------------------------------------
     # Verificaciones
     # -------------------------------------------------------------------------
@@ -177,10 +476,10 @@ class Carga:
 
         try:
             target_path = self._resolve_output_path(db_path, self.sqlite_path)
-            with sqlite3.connect(target_path) as conn:
-                count_sqlite = pd.read_sql_query(
-                    "SELECT COUNT(*) FROM listings_analitica", conn
-                ).iloc[0, 0]
+            with closing(sqlite3.connect(target_path)) as conn:
+                count_sqlite = conn.execute(
+                    "SELECT COUNT(*) FROM listings_analitica"
+                ).fetchone()[0]
             if count_sqlite == len(self.df_final):
                 self.logger.info(f"✅ SQLite ok ({count_sqlite} registros)")
             else:
@@ -195,58 +494,90 @@ class Carga:
             if not target_path.exists():
                 raise FileNotFoundError(target_path)
 
-            try:
-                from openpyxl import load_workbook
-            except ImportError as exc:  # pragma: no cover - depende de entorno
-                self.logger.warning(f"No se pudo verificar XLSX: falta openpyxl ({exc})")
-                return
+            filas_por_hoja = self._xlsx_sheet_rows(target_path)
+            for base_name, sheets in self._excel_registry.items():
+                if not sheets:
+                    continue
 
-            workbook = load_workbook(target_path, read_only=True)
-            try:
-                for base_name, sheets in self._excel_registry.items():
-                    if not sheets:
-                        continue
-
-                    total_rows = 0
-                    for sheet_name, expected_rows in sheets:
-                        if sheet_name not in workbook.sheetnames:
-                            self.logger.warning(
-                                f"❌ Hoja '{sheet_name}' no encontrada para '{base_name}'"
-                            )
-                            break
-                        hoja = workbook[sheet_name]
-                        actual_rows = max(hoja.max_row - 1, 0)
-                        if actual_rows != expected_rows:
-                            self.logger.warning(
-                                f"❌ XLSX mismatch en '{sheet_name}' (Esperado: {expected_rows}, Encontrado: {actual_rows})"
-                            )
-                            break
-                        total_rows += actual_rows
+                total_rows = 0
+                for sheet_name, expected_rows in sheets:
+                    if sheet_name not in filas_por_hoja:
+                        self.logger.warning(
+                            f"❌ Hoja '{sheet_name}' no encontrada para '{base_name}'"
+                        )
+                        break
+                    actual_rows = filas_por_hoja[sheet_name]
+                    if actual_rows != expected_rows:
+                        self.logger.warning(
+                            f"❌ XLSX mismatch en '{sheet_name}' (Esperado: {expected_rows}, Encontrado: {actual_rows})"
+                        )
+                        break
+                    total_rows += actual_rows
+                else:
+                    esperado = self._expected_rows.get(base_name, 0)
+                    if total_rows == esperado:
+                        self.logger.info(
+                            f"✅ XLSX '{base_name}' ok ({total_rows} registros en {len(sheets)} hojas)"
+                        )
                     else:
-                        esperado = self._expected_rows.get(base_name, 0)
-                        if total_rows == esperado:
-                            self.logger.info(
-                                f"✅ XLSX '{base_name}' ok ({total_rows} registros en {len(sheets)} hojas)"
-                            )
-                        else:
-                            self.logger.warning(
-                                f"❌ XLSX mismatch en '{base_name}' (Esperado total: {esperado}, Encontrado: {total_rows})"
-                            )
-            finally:
-                workbook.close()
+                        self.logger.warning(
+                            f"❌ XLSX mismatch en '{base_name}' (Esperado total: {esperado}, Encontrado: {total_rows})"
+                        )
         except Exception as exc:  # pragma: no cover - logging de fallos
             self.logger.error(f"❌ Error al verificar XLSX: {exc}")
 
+        self.verificar_parquet()
         self.logger.info("Verificación finalizada")
 
+    def verificar_parquet(self) -> None:
+        """Compara las filas de cada Parquet escrito leyendo sólo su footer."""
+        if not self._parquet_registry:
+            return
+        try:
+            import pyarrow.parquet as pq
+
+            for target_path, expected_rows in self._parquet_registry.items():
+                actual_rows = pq.read_metadata(target_path).num_rows
+                if actual_rows == expected_rows:
+                    self.logger.info(f"✅ Parquet '{target_path.name}' ok ({actual_rows} registros)")
+                else:
+                    self.logger.warning(
+                        f"❌ Parquet mismatch en '{target_path.name}' (Esperado: {expected_rows}, Encontrado: {actual_rows})"
+                    )
+        except Exception as exc:  # pragma: no cover - logging de fallos
+            self.logger.error(f"❌ Error al verificar Parquet: {exc}")
+
     # -------------------------------------------------------------------------
     # Operación completa
     # -------------------------------------------------------------------------
+    def _cargar_diferido(self, tarea) -> tuple:
+        """Ejecuta `tarea` sobre una copia de la carga cuyos logs quedan en memoria."""
+        carga = copy.copy(self)
+        carga.logger = LogsDiferido()
+        return tarea(carga), carga.logger
+
     def ejecutar_carga_completa(self) -> None:
         """Ejecuta la carga en todos los destinos y realiza las verificaciones."""
         self.logger.nueva_entrada("Inicio de carga completa")
-        sqlite_ok = self.cargar_sqlite()
-        xlsx_ok = self.cargar_xlsx()
+        # Destinos independientes en hilos: SQLite/ADBC y pyarrow liberan el GIL,
+        # de modo que su escritura se solapa con la del XLSX (xlsxwriter es
+        # Python puro y no avanza en paralelo consigo mismo).
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futuros = [
+                executor.submit(self._cargar_diferido, lambda carga: carga.cargar_sqlite()),
+                executor.submit(self._cargar_diferido, lambda carga: carga.cargar_xlsx()),
+                executor.submit(
+                    self._cargar_diferido,
+                    lambda carga: (carga.cargar_parquet(), carga.cargar_feather()),
+                ),
+            ]
+            resultados = []
+            # Cada sección del log se escribe completa y en orden desde este hilo
+            for futuro in futuros:
+                resultado, registro = futuro.result()
+                registro.volcar(self.logger)
+                resultados.append(resultado)
+        sqlite_ok, xlsx_ok, _ = resultados
 
         if sqlite_ok or xlsx_ok:
             self.verificar_carga()
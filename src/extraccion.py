@@ -1,5 +1,6 @@
 """Módulo de extracción para cargar colecciones de MongoDB en DataFrames."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import pandas as pd
@@ -9,6 +10,11 @@ from pymongo.errors import PyMongoError
 
 from logs_manage import Logs
 
+try:
+    from pymongoarrow.api import Schema, find_arrow_all
+except ImportError:  # pragma: no cover - depende de entorno
+    Schema = find_arrow_all = None
+
 
 class Extraccion:
     """
@@ -16,16 +22,49 @@ class Extraccion:
     Conecta a la base de datos bi_mx y extrae las colecciones: listings, reviews, calendar.
     """
 
-    def __init__(self, uri: str, db_name: str, logger: Optional[Logs] = None) -> None:
+    # Campos requeridos por colección (las que no aparecen se extraen completas)
+    PROYECCIONES: dict[str, dict] = {
+        "calendar": {"listing_id": 1, "date": 1, "available": 1},
+    }
+
+    # Esquemas para PyMongoArrow. Sin esquema el tipo de cada campo se infiere
+    # de su primera aparición en cada lote: un 1.5 después de un 1 llega como 1,
+    # un "" inicial anula los números siguientes y lotes con tipos distintos no
+    # se pueden concatenar. Un valor de otro tipo (p. ej. un booleano en
+    # available o una fecha BSON en date) hace fallar la lectura Arrow y la
+    # colección se relee con cursor en lugar de convertirse en nulos.
+    # listings tiene demasiados campos heterogéneos y se lee siempre con cursor.
+    ESQUEMAS_ARROW: dict[str, dict[str, type]] = {
+        "reviews": {
+            "listing_id": int,
+            "id": int,
+            "date": str,
+            "reviewer_id": int,
+            "reviewer_name": str,
+            "comments": str,
+        },
+        "calendar": {"listing_id": int, "date": str, "available": str},
+    }
+
+    def __init__(
+        self,
+        uri: str,
+        db_name: str,
+        logger: Optional[Logs] = None,
+        limites: Optional[dict[str, int]] = None,
+    ) -> None:
         """
         Inicializar extractor de datos.
         
         Args:
             uri: URI de conexión a MongoDB
             db_name: Nombre de la base de datos
+            limites: Máximo de documentos a leer por colección (p. ej. la
+                muestra de reviews que se analizará)
         """
         self.uri = uri
         self.db_name = db_name
+        self.limites = limites or {}
         self.logger = (
             logger.crear_sublogger(header="LOG DE EXTRACCIÓN - AIRBNB CDMX")
             if logger
@@ -68,12 +107,55 @@ class Extraccion:
             self.logger.error(f"✗ Error inesperado al conectar: {str(e)}")
             return False
 
-    def _extraer_coleccion(self, nombre_coleccion: str) -> DataFrame:
+    @staticmethod
+    def _cursor_a_dataframe(cursor) -> DataFrame:
+        """
+        Construir un DataFrame columna por columna a partir de un cursor.
+        
+        Los valores se acumulan en una lista por campo (en lugar de una lista
+        de documentos), de modo que nunca se mantienen en memoria todos los
+        dicts de la colección a la vez.
+        
+        Args:
+            cursor: Cursor de PyMongo a consumir
+            
+        Returns:
+            DataFrame con un campo por columna
+        """
+        columnas: dict[str, list] = {}
+        total = 0
+        for documento in cursor:
+            for campo, valor in documento.items():
+                columna = columnas.get(campo)
+                if columna is None:
+                    # Campo nuevo: rellenar con nulos los documentos previos
+                    columna = columnas[campo] = [None] * total
+                columna.append(valor)
+            total += 1
+            if len(documento) != len(columnas):
+                # Campos ausentes en este documento
+                for columna in columnas.values():
+                    if len(columna) < total:
+                        columna.append(None)
+        return pd.DataFrame(columnas)
+
+    def _extraer_coleccion(
+        self,
+        nombre_coleccion: str,
+        projection: Optional[dict] = None,
+        batch_size: int = 10_000,
+        limit: int = 0,
+    ) -> DataFrame:
         """
         Método privado para extraer una colección y convertirla en DataFrame.
         
         Args:
             nombre_coleccion: Nombre de la colección a extraer
+            projection: Campos a traer desde MongoDB (None trae todos salvo _id).
+                Las colecciones con esquema en ESQUEMAS_ARROW traen siempre
+                los campos del esquema y esta proyección se ignora.
+            batch_size: Documentos por lote que devuelve el servidor
+            limit: Máximo de documentos a leer (0 lee la colección completa)
             
         Returns:
             DataFrame con los datos de la colección
@@ -81,16 +163,37 @@ class Extraccion:
         try:
             self.logger.info(f"\n--- EXTRAYENDO COLECCIÓN: {nombre_coleccion} ---")
             
-            # Extraer documentos de la colección
+            # Extraer documentos de la colección (_id se descarta en el servidor)
             coleccion = self._db[nombre_coleccion]
-            documentos = list(coleccion.find())
-            
-            # Convertir a DataFrame
-            df = pd.DataFrame(documentos)
-            
-            # Eliminar _id de MongoDB si existe
-            if not df.empty and "_id" in df.columns:
-                df = df.drop(columns="_id")
+            esquema = self.ESQUEMAS_ARROW.get(nombre_coleccion)
+            if esquema is not None:
+                proyeccion = {"_id": 0, **dict.fromkeys(esquema, 1)}
+            else:
+                proyeccion = {"_id": 0, **(projection or {})}
+            df = None
+            if find_arrow_all is not None and esquema is not None:
+                # PyMongoArrow decodifica el BSON directo a columnas Arrow (sin dicts de Python)
+                try:
+                    tabla = find_arrow_all(
+                        coleccion,
+                        {},
+                        schema=Schema(esquema),
+                        allow_invalid=False,
+                        projection=proyeccion,
+                        batch_size=batch_size,
+                        limit=limit,
+                    )
+                    df = tabla.to_pandas(self_destruct=True, split_blocks=True)
+                except (TypeError, ValueError) as e:
+                    self.logger.warning(
+                        f"Tipos fuera del esquema Arrow en {nombre_coleccion} ({e}); "
+                        "se lee con cursor"
+                    )
+            if df is None:
+                cursor = coleccion.find({}, proyeccion, limit=limit).batch_size(batch_size)
+                
+                # Convertir a DataFrame
+                df = self._cursor_a_dataframe(cursor)
             
             # Registrar resultados
             cantidad = len(df)
@@ -123,10 +226,21 @@ class Extraccion:
             if not self.conectar():
                 raise RuntimeError("No se pudo establecer conexión con MongoDB")
             
-            # Extraer cada colección usando el método privado
-            df_listings = self._extraer_coleccion("listings")
-            df_reviews = self._extraer_coleccion("reviews")
-            df_calendar = self._extraer_coleccion("calendar")
+            # Extraer las colecciones en paralelo (MongoClient es thread-safe)
+            colecciones = ("listings", "reviews", "calendar")
+            with ThreadPoolExecutor(max_workers=len(colecciones)) as executor:
+                futuros = {
+                    nombre: executor.submit(
+                        self._extraer_coleccion,
+                        nombre,
+                        self.PROYECCIONES.get(nombre),
+                        limit=self.limites.get(nombre, 0),
+                    )
+                    for nombre in colecciones
+                }
+                df_listings, df_reviews, df_calendar = (
+                    futuros[nombre].result() for nombre in colecciones
+                )
             
             # Registrar resumen
             total = len(df_listings) + len(df_reviews) + len(df_calendar)
@@ -1,20 +1,56 @@
 """Utilidades de logging sencillo con archivos por ejecución."""
 from __future__ import annotations
 
+import atexit
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TextIO, Union
+
+# Compartido por todos los loggers: los subloggers escriben en el mismo archivo.
+_WRITE_LOCK = threading.Lock()
+# Un único handle abierto (con buffer) por archivo de log durante toda la ejecución.
+_HANDLES: dict[Path, TextIO] = {}
+
+# Un mensaje puede pasarse ya formateado o como callable que lo construye sólo si se registra.
+Mensaje = Union[str, Callable[[], str]]
+
+
+def _open_handle(log_file: Path) -> TextIO:
+    key = log_file.resolve()
+    with _WRITE_LOCK:
+        fh = _HANDLES.get(key)
+        if fh is None or fh.closed:
+            fh = open(log_file, "a", encoding="utf-8", buffering=1 << 16)
+            _HANDLES[key] = fh
+        return fh
+
+
+@atexit.register
+def _close_handles() -> None:
+    with _WRITE_LOCK:
+        for fh in _HANDLES.values():
+            fh.close()
+        _HANDLES.clear()
 
 
 class Logs:
     """Gestiona el registro de eventos en un archivo de log por ejecución."""
 
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
     def __init__(
         self,
         log_dir: str | Path = "logs",
         log_file: Optional[str | Path] = None,
         header: Optional[str] = None,
+        level: int = INFO,
     ) -> None:
+        self.level = level
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
 
@@ -26,42 +62,64 @@ class Logs:
             if not self.log_file.is_absolute():
                 self.log_file = self.log_dir / self.log_file
 
-        if not self.log_file.exists():
+        # Marca de tiempo formateada, recalculada sólo cuando cambia el segundo
+        self._last_sec = -1
+        self._last_ts = ""
+
+        is_new = not self.log_file.exists()
+        self._fh = _open_handle(self.log_file)
+        if is_new:
             self._write_header(header)
 
     # ------------------------------------------------------------------
     def _write_header(self, header: Optional[str]) -> None:
         default_header = header or "LOG DE PROCESO - AIRBNB CDMX"
-        with open(self.log_file, "w", encoding="utf-8") as fh:
-            fh.write("=" * 70 + "\n")
-            fh.write(f"{default_header}\n")
-            fh.write("=" * 70 + "\n")
-            fh.write(f"Fecha de inicio: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
-            fh.write("=" * 70 + "\n\n")
+        with _WRITE_LOCK:
+            self._fh.write("=" * 70 + "\n")
+            self._fh.write(f"{default_header}\n")
+            self._fh.write("=" * 70 + "\n")
+            self._fh.write(f"Fecha de inicio: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+            self._fh.write("=" * 70 + "\n\n")
 
     # ------------------------------------------------------------------
-    def _write(self, level: str, message: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"[{timestamp}] [{level.upper()}] {message}\n"
-        with open(self.log_file, "a", encoding="utf-8") as fh:
-            fh.write(line)
+    def _write(self, level: str, message: Mensaje, timestamp: Optional[float] = None) -> None:
+        if callable(message):
+            message = message()
+        now = int(time.time() if timestamp is None else timestamp)
+        if now != self._last_sec:
+            self._last_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_sec = now
+        line = f"[{self._last_ts}] [{level.upper()}] {message}\n"
+        with _WRITE_LOCK:
+            self._fh.write(line)
+            if level == "ERROR":
+                self._fh.flush()
 
     # ------------------------------------------------------------------
-    def info(self, message: str) -> None:
-        self._write("INFO", message)
+    def debug(self, message: Mensaje, timestamp: Optional[float] = None) -> None:
+        if self.level <= self.DEBUG:
+            self._write("DEBUG", message, timestamp)
+
+    def info(self, message: Mensaje, timestamp: Optional[float] = None) -> None:
+        if self.level <= self.INFO:
+            self._write("INFO", message, timestamp)
 
-    def warning(self, message: str) -> None:
-        self._write("WARNING", message)
+    def warning(self, message: Mensaje, timestamp: Optional[float] = None) -> None:
+        if self.level <= self.WARNING:
+            self._write("WARNING", message, timestamp)
 
-    def error(self, message: str) -> None:
-        self._write("ERROR", message)
+    def error(self, message: Mensaje, timestamp: Optional[float] = None) -> None:
+        if self.level <= self.ERROR:
+            self._write("ERROR", message, timestamp)
 
     # ------------------------------------------------------------------
-    def nueva_entrada(self, contexto: str) -> None:
+    def nueva_entrada(self, contexto: str, timestamp: Optional[float] = None) -> None:
         """Inserta un separador con contexto para secciones largas."""
-        self.info("-" * 50)
-        self.info(contexto)
-        self.info("-" * 50)
+        if self.level > self.INFO:
+            return
+        self.info("-" * 50, timestamp)
+        self.info(contexto, timestamp)
+        self.info("-" * 50, timestamp)
 
     # ------------------------------------------------------------------
     @property
@@ -70,5 +128,43 @@ class Logs:
 
     # ------------------------------------------------------------------
     def crear_sublogger(self, header: Optional[str] = None) -> "Logs":
-        """Devuelve un nuevo logger que reutiliza el mismo archivo."""
-        return Logs(log_dir=self.log_dir, log_file=self.log_file.name, header=header)
+        """Devuelve un nuevo logger que reutiliza el mismo archivo (y su handle)."""
+        return Logs(
+            log_dir=self.log_dir,
+            log_file=self.log_file.name,
+            header=header,
+            level=self.level,
+        )
+
+
+class LogsDiferido:
+    """Acumula mensajes en memoria y los vuelca juntos en un `Logs`.
+
+    Permite que tareas en hilos paralelos registren su sección completa sin
+    intercalarse con las demás: el hilo principal la vuelca al terminar.
+    Cada mensaje conserva la hora en que se registró, no la del volcado.
+    """
+
+    def __init__(self) -> None:
+        self._mensajes: list[tuple[str, Mensaje, float]] = []
+
+    def debug(self, message: Mensaje) -> None:
+        self._mensajes.append(("debug", message, time.time()))
+
+    def info(self, message: Mensaje) -> None:
+        self._mensajes.append(("info", message, time.time()))
+
+    def warning(self, message: Mensaje) -> None:
+        self._mensajes.append(("warning", message, time.time()))
+
+    def error(self, message: Mensaje) -> None:
+        self._mensajes.append(("error", message, time.time()))
+
+    def nueva_entrada(self, contexto: str) -> None:
+        self._mensajes.append(("nueva_entrada", contexto, time.time()))
+
+    def volcar(self, destino: Logs) -> None:
+        """Escribe en `destino` los mensajes acumulados, en su orden original."""
+        for metodo, message, timestamp in self._mensajes:
+            getattr(destino, metodo)(message, timestamp)
+        self._mensajes.clear()
@@ -6,6 +6,9 @@ from extraccion import Extraccion
 from transformacion import Transformacion
 from carga import Carga
 
+# Reviews analizadas; también limita la lectura desde MongoDB
+MUESTRA_REVIEWS = 15_000
+
 
 def run_pipeline() -> None:
     """Orquesta la extracción, transformación y carga de datos."""
@@ -13,13 +16,19 @@ def run_pipeline() -> None:
     logger.info("Iniciando pipeline ETL")
 
     try:
-        extractor = Extraccion(uri="mongodb://localhost:27017/", db_name="bi_mx", logger=logger)
+        extractor = Extraccion(
+            uri="mongodb://localhost:27017/",
+            db_name="bi_mx",
+            logger=logger,
+            limites={"reviews": MUESTRA_REVIEWS},
+        )
         df_listings, df_reviews, df_calendar = extractor.extraer_todas()
 
         transformador = Transformacion(
             df_listings=df_listings,
             df_reviews_completo=df_reviews,
             df_calendar=df_calendar,
+            muestra_reviews=MUESTRA_REVIEWS,
             logger=logger,
         )
         df_final = transformador.ejecutar_transformacion_completa()
@@ -1,23 +1,148 @@
 """Transformaciones de datos para listings, reviews y calendar."""
 from __future__ import annotations
 
-from collections import Counter
 from typing import Optional, Tuple
 
 import ast
+import functools
+import json
+import re
+import warnings
+import numpy as np
 import pandas as pd
+import polars as pl
 import nltk
-from langdetect import detect, DetectorFactory
+from joblib import Parallel, delayed
+from langdetect import DetectorFactory
+from langdetect.detector_factory import PROFILES_DIRECTORY
 from langdetect.lang_detect_exception import LangDetectException
 from nltk.sentiment import SentimentIntensityAnalyzer
+from sklearn.preprocessing import MultiLabelBinarizer
 from textblob import TextBlob
 
 from logs_manage import Logs
 
+# Copy-on-Write (por defecto en pandas 3) evita copias defensivas de los
+# DataFrames de entrada: sólo se copia una columna cuando se modifica
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+_PRICE_RE = re.compile(r"[\$,]")
+_SP_HINT_RE = re.compile(r"[ñ¿¡]", re.IGNORECASE)
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+_SAFE_NAME_TABLE = str.maketrans({" ": "_", "/": "_", "-": "_", ".": "_"})
+_RESPONSE_TIME_MAP = {
+    "within an hour": "Fast",
+    "within a few hours": "Fast",
+    "within a day": "Moderate",
+    "a few days or more": "Slow",
+}
+# Por debajo de este largo langdetect no es fiable; por encima de
+# _MAX_DETECCION caracteres la detección ya no cambia
+_MIN_DETECCION = 20
+_MAX_DETECCION = 200
+_RESPONSE_SPEED_CATEGORIES = ["Unknown", "Slow", "Moderate", "Fast"]
+_SENTIMIENTO_CATEGORIES = ["Negativo", "Neutral", "Positivo"]
+
+DetectorFactory.seed = 0
+
+
+def _parse_list_literal(value: str):
+    """Interpreta una lista serializada; devuelve ``None`` si no lo es.
+
+    Las amenidades llegan como JSON, por lo que ``json.loads`` resuelve casi
+    todos los casos; ``ast.literal_eval`` queda para listas con comillas simples.
+    """
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return None
+    return parsed if isinstance(parsed, list) else None
+
+
+def _como_texto(serie: pd.Series) -> pd.Series:
+    """Convierte a ``string[pyarrow]`` conservando los nulos (sin ``"nan"``)."""
+    if isinstance(serie.dtype, pd.StringDtype):
+        return serie
+    return serie.astype("string[pyarrow]")
+
+
+def _flag_a_int8(serie: pd.Series) -> pd.Series:
+    """Convierte una bandera ``"t"``/``"f"`` o booleana a ``int8`` (1/0)."""
+    if pd.api.types.is_bool_dtype(serie):
+        return serie.astype("int8")
+    if pd.api.types.is_numeric_dtype(serie):
+        return serie
+    return serie.eq("t").astype("int8")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_detector():
+    """Detector de langdetect con los perfiles cargados una sola vez por proceso."""
+    factory = DetectorFactory()
+    factory.load_profile(PROFILES_DIRECTORY)
+    return factory.create()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vader() -> SentimentIntensityAnalyzer:
+    """Analizador VADER compartido; descarga el léxico si no está disponible."""
+    try:
+        nltk.data.find("sentiment/vader_lexicon.zip")
+    except LookupError:
+        nltk.download("vader_lexicon")
+    return SentimentIntensityAnalyzer()
+
+
+def _detectar_idioma(texto: str) -> str:
+    """Detecta el idioma reutilizando un único detector de langdetect.
+
+    ``langdetect.detect`` crea un detector nuevo en cada llamada; aquí sólo se
+    reinicia el estado del texto del detector compartido.
+    """
+    detector = _get_detector()
+    detector.text = ""
+    detector.langprob = None
+    detector.append(texto)
+    return detector.detect()
+
+
+def _sentiment_score(comentario: str) -> float:
+    """Puntuación de sentimiento: TextBlob para español, VADER para el resto.
+
+    Es una función de módulo para poder enviarla a los procesos de joblib;
+    cada proceso construye su propio detector y analizador la primera vez.
+    """
+    if pd.isna(comentario) or not str(comentario).strip():
+        return 0.0
+    comentario_str = str(comentario).strip()
+    if len(comentario_str) < _MIN_DETECCION:
+        idioma = "unk"
+    elif _SP_HINT_RE.search(comentario_str):
+        idioma = "es"
+    else:
+        try:
+            idioma = _detectar_idioma(comentario_str[:_MAX_DETECCION])
+        except LangDetectException:
+            idioma = "unk"
+    try:
+        if idioma == "es":
+            score = TextBlob(comentario_str).sentiment.polarity
+        else:
+            score = _get_vader().polarity_scores(comentario_str)["compound"]
+    except Exception:
+        score = 0.0
+    return score
+
 
 class Transformacion:
     """Encapsula el proceso de limpieza y enriquecimiento de los datos."""
 
+    LOTE_SENTIMIENTO = 512
+
     def __init__(
         self,
         df_listings: pd.DataFrame,
@@ -41,107 +166,99 @@ class Transformacion:
         self.df_calendar_agregado: Optional[pd.DataFrame] = None
         self.df_final: Optional[pd.DataFrame] = None
 
-        DetectorFactory.seed = 0
-        try:
-            nltk.data.find("sentiment/vader_lexicon.zip")
-        except LookupError:
-            nltk.download("vader_lexicon")
-        self._vader = SentimentIntensityAnalyzer()
+        # Carga el léxico en el proceso principal antes de repartir a los workers
+        _get_vader()
         self.logger.info("Clase Transformacion inicializada")
-        self.logger.info(f"Dimensiones iniciales - listings: {df_listings.shape}, reviews: {df_reviews_completo.shape}, calendar: {df_calendar.shape}")
+        self.logger.info(lambda: f"Dimensiones iniciales - listings: {df_listings.shape}, reviews: {df_reviews_completo.shape}, calendar: {df_calendar.shape}")
 
     # ------------------------------------------------------------------
     def _parse_amenities(self, value) -> list:
-        if isinstance(value, list):
+        if isinstance(value, (list, tuple, np.ndarray)):
             return [str(item).strip().lower() for item in value if str(item).strip()]
         if isinstance(value, str):
-            try:
-                parsed = ast.literal_eval(value)
-                if isinstance(parsed, list):
-                    return [str(item).strip().lower() for item in parsed if str(item).strip()]
-            except (ValueError, SyntaxError):
-                pass
+            parsed = _parse_list_literal(value)
+            if parsed is not None:
+                return [str(item).strip().lower() for item in parsed if str(item).strip()]
             return [str(item).strip().lower() for item in value.split(",") if str(item).strip()]
         return []
 
     # ------------------------------------------------------------------
     def _clean_listings(self) -> None:
         self.logger.nueva_entrada("Transformación de listings")
-        df = self.df_listings.copy()
+        df = self.df_listings.copy(deep=False)
 
         # Normalizar porcentajes del host
         for col in ["host_response_rate", "host_acceptance_rate"]:
-            if col in df.columns:
-                df[col] = (
-                    df[col]
-                    .astype(str)
-                    .str.replace("%", "", regex=False)
-                    .str.strip()
-                )
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(
+                    _como_texto(df[col]).str.replace("%", "", regex=False).str.strip(),
+                    errors="coerce",
+                ).astype("float64")
 
         # Mapear velocidad de respuesta
-        response_time_map = {
-            "within an hour": "Fast",
-            "within a few hours": "Fast",
-            "within a day": "Moderate",
-            "a few days or more": "Slow",
-        }
         if "host_response_time" in df.columns:
-            df["host_response_speed"] = df["host_response_time"].map(response_time_map)
-            df["host_response_speed"].fillna("Unknown", inplace=True)
+            df["host_response_speed"] = pd.Categorical(
+                df["host_response_time"].map(_RESPONSE_TIME_MAP).fillna("Unknown"),
+                categories=_RESPONSE_SPEED_CATEGORIES,
+            )
 
         # Columnas host_verifications → one hot
         if "host_verifications" in df.columns:
-            df["host_verifications"] = df["host_verifications"].apply(
-                lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-            )
-            df["host_verifications"] = df["host_verifications"].apply(
-                lambda x: x if isinstance(x, list) else []
-            )
-            df_verifications = (
-                df["host_verifications"].apply(lambda x: pd.Series(1, index=x))
-                .fillna(0)
-                .astype(int)
+            # Pocos valores distintos: se interpreta cada uno una sola vez
+            verificaciones = {
+                valor: _parse_list_literal(valor) or []
+                for valor in {v for v in df["host_verifications"] if isinstance(v, str)}
+            }
+            df["host_verifications"] = [
+                verificaciones[x] if isinstance(x, str)
+                else list(x) if isinstance(x, (list, tuple, np.ndarray))
+                else []
+                for x in df["host_verifications"]
+            ]
+            mlb = MultiLabelBinarizer()
+            matriz = mlb.fit_transform(df["host_verifications"])
+            df_verifications = pd.DataFrame(
+                matriz,
+                index=df.index,
+                columns=[f"verif_{col}" for col in mlb.classes_],
             )
-            df_verifications.columns = [f"verif_{col}" for col in df_verifications.columns]
             df = pd.concat([df, df_verifications], axis=1)
-            df.drop(columns=["host_verifications"], inplace=True)
 
         # Amenities top 12 + conteo
         if "amenities" in df.columns:
             df["amenities_list"] = df["amenities"].apply(self._parse_amenities)
             all_amenities = df["amenities_list"].explode()
-            top_12 = [amen for amen, _ in Counter(all_amenities).most_common(12)]
-            unique_amenities = all_amenities.dropna().unique() if not all_amenities.empty else []
-            self.logger.info(f"Amenidades únicas analizadas: {len(unique_amenities)}")
-            for amen in top_12:
-                safe_name = (
-                    amen.replace(" ", "_")
-                    .replace("/", "_")
-                    .replace("-", "_")
-                    .replace(".", "_")
-                )
-                df[f"amen_{safe_name}"] = df["amenities_list"].apply(lambda x: int(amen in x))
+            frecuencias = all_amenities.value_counts()
+            top_12 = frecuencias.head(12).index.tolist()
+            self.logger.info(lambda: f"Amenidades únicas analizadas: {len(frecuencias)}")
+            safe_names = [amen.translate(_SAFE_NAME_TABLE) for amen in top_12]
+            # Las amenidades fuera del top 12 se ignoran de forma intencional
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                matriz = MultiLabelBinarizer(classes=top_12).fit_transform(df["amenities_list"])
+            df_amenities = pd.DataFrame(
+                matriz,
+                index=df.index,
+                columns=[f"amen_{name}" for name in safe_names],
+            )
+            # Amenidades que sólo difieren en espacios o guiones ("hair dryer" y
+            # "hair-dryer") comparten nombre seguro: se unen en una sola columna
+            if df_amenities.columns.has_duplicates:
+                df_amenities = df_amenities.T.groupby(level=0, sort=False).max().T
+            df = pd.concat([df, df_amenities], axis=1)
             df["amenities_count"] = df["amenities_list"].apply(len)
-            df.drop(columns=["amenities", "amenities_list"], inplace=True)
 
         # Limpieza de precio
         if "price" in df.columns:
-            df["price"] = (
-                df["price"]
-                .astype(str)
-                .str.replace(r"[\$,]", "", regex=True)
-                .str.strip()
-            )
-            df["price"] = pd.to_numeric(df["price"], errors="coerce")
+            if not pd.api.types.is_numeric_dtype(df["price"]):
+                df["price"] = pd.to_numeric(
+                    _como_texto(df["price"]).str.replace(_PRICE_RE, "", regex=True).str.strip(),
+                    errors="coerce",
+                ).astype("float64")
             df.dropna(subset=["price"], inplace=True)
 
-        # Imputaciones
-        for col in ["bedrooms", "beds", "bathrooms"]:
-            if col in df.columns and df[col].isnull().any():
-                df[col].fillna(df[col].median(), inplace=True)
-
+        # Imputaciones: medianas para capacidad y 0 para puntuaciones, en un solo fillna
+        cols_mediana = [c for c in ["bedrooms", "beds", "bathrooms"] if c in df.columns]
         score_cols = [
             "review_scores_rating",
             "review_scores_accuracy",
@@ -152,62 +269,57 @@ class Transformacion:
             "review_scores_value",
             "reviews_per_month",
         ]
-        for col in score_cols:
-            if col in df.columns:
-                df[col].fillna(0, inplace=True)
+        rellenos = df[cols_mediana].median().to_dict()
+        rellenos.update({col: 0 for col in score_cols if col in df.columns})
+        df = df.fillna(rellenos)
 
         if "has_availability" in df.columns:
-            df["has_availability"].fillna(df["has_availability"].mode()[0], inplace=True)
-            if df["has_availability"].dtype == "object":
-                df["has_availability"] = df["has_availability"].apply(lambda x: 1 if x == "t" else 0)
-            elif pd.api.types.is_bool_dtype(df["has_availability"]):
-                df["has_availability"] = df["has_availability"].astype(int)
+            df["has_availability"] = df["has_availability"].fillna(df["has_availability"].mode()[0])
+            df["has_availability"] = _flag_a_int8(df["has_availability"])
 
         # Normalizar host_is_superhost a binario (1=superhost, 0=no superhost)
         if "host_is_superhost" in df.columns:
-            df["host_is_superhost"].fillna("f", inplace=True)
-            if df["host_is_superhost"].dtype == "object":
-                df["host_is_superhost"] = df["host_is_superhost"].apply(lambda x: 1 if x == "t" else 0)
-            elif pd.api.types.is_bool_dtype(df["host_is_superhost"]):
-                df["host_is_superhost"] = df["host_is_superhost"].astype(int)
+            df["host_is_superhost"] = df["host_is_superhost"].fillna("f")
+            df["host_is_superhost"] = _flag_a_int8(df["host_is_superhost"])
 
         # Limpieza de neighbourhood
         if "neighbourhood" in df.columns:
             df["neighbourhood_cleaned"] = (
-                df["neighbourhood"]
-                .astype(str)
-                .str.split(",")
-                .str.get(0)
+                _como_texto(df["neighbourhood"])
+                .str.replace(",.*", "", regex=True)
                 .str.normalize("NFKD")
-                .str.encode("ascii", "ignore")
-                .str.decode("ascii")
+                .str.replace(_NON_ASCII_RE, "", regex=True)
                 .str.lower()
                 .str.strip()
             )
 
-        # Outliers (IQR)
-        for col in ["bathrooms", "bedrooms", "beds", "price"]:
-            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-                q1 = df[col].quantile(0.25)
-                q3 = df[col].quantile(0.75)
-                iqr = q3 - q1
-                lower = q1 - 1.5 * iqr
-                upper = q3 + 1.5 * iqr
-                df = df[(df[col] >= lower) & (df[col] <= upper)]
-
-        # Outliers manuales
+        # Outliers (IQR) y límites manuales en una sola máscara
         limites = {
             "bathrooms": 10,
             "bedrooms": 10,
             "beds": 15,
             "price": 400000,
         }
-        for col, limite in limites.items():
-            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-                df = df[df[col] <= limite]
-
-        # Columnas con muchos nulos u obsoletas
+        cols_outliers = [
+            col for col in limites
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col])
+        ]
+        if cols_outliers:
+            # Matriz float64 única: el límite manual se funde con la cota superior
+            # del IQR y los NaN quedan fuera porque toda comparación es False
+            valores = df[cols_outliers].to_numpy(dtype=np.float64, na_value=np.nan)
+            q1, q3 = np.nanquantile(valores, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            inferior = q1 - 1.5 * iqr
+            superior = np.minimum(q3 + 1.5 * iqr, [limites[col] for col in cols_outliers])
+            mask = ((valores >= inferior) & (valores <= superior)).all(axis=1)
+            df = df[mask]
+
+        # Columnas con muchos nulos, obsoletas o ya codificadas (un solo drop)
         cols_drop = [
+            "host_verifications",
+            "amenities",
+            "amenities_list",
             "description",
             "host_name",
             "host_since",
@@ -229,64 +341,78 @@ class Transformacion:
             "minimum_maximum_nights",
             "maximum_maximum_nights",
         ]
-        df.drop(columns=[c for c in cols_drop if c in df.columns], inplace=True)
+        df = df.drop(columns=[c for c in cols_drop if c in df.columns])
+
+        # Tipos compactos: enteros al menor ancho sin pérdida (one hot → int8)
+        # y textos repetitivos como category; los floats se mantienen en float64
+        cols_enteras = list(df.select_dtypes(include="integer").columns) + ["bedrooms", "beds"]
+        for col in cols_enteras:
+            if col in df.columns and col != "id" and not col.endswith("_id"):
+                df[col] = pd.to_numeric(df[col], downcast="integer")
+        for col in ["neighbourhood_cleaned", "room_type", "property_type"]:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
 
-        self.df_limpio = df.reset_index(drop=True)
+        df.index = pd.RangeIndex(len(df))
+        self.df_limpio = df
         self.logger.info(f"DataFrame listings limpio con forma {self.df_limpio.shape}")
 
     # ------------------------------------------------------------------
-    def _sentiment_score(self, comentario: str) -> Tuple[str, float]:
-        if pd.isna(comentario) or not str(comentario).strip():
-            return "Neutral", 0.0
-        comentario_str = str(comentario).strip()
-        try:
-            idioma = detect(comentario_str)
-        except LangDetectException:
-            idioma = "unk"
-        try:
-            if idioma == "es":
-                score = TextBlob(comentario_str).sentiment.polarity
-            else:
-                score = self._vader.polarity_scores(comentario_str)["compound"]
-        except Exception:
-            score = 0.0
-        if score >= 0.05:
-            return "Positivo", score
-        if score <= -0.05:
-            return "Negativo", score
-        return "Neutral", score
+    def _sentiment_score_batch(self, comentarios: np.ndarray) -> Tuple[np.ndarray, pd.Categorical]:
+        """Devuelve las puntuaciones (float64) y sus etiquetas categóricas."""
+        n_jobs = -1 if len(comentarios) > self.LOTE_SENTIMIENTO else 1
+        puntuaciones = np.fromiter(
+            Parallel(n_jobs=n_jobs, batch_size=self.LOTE_SENTIMIENTO)(
+                delayed(_sentiment_score)(c) for c in comentarios
+            ),
+            dtype=np.float64,
+            count=len(comentarios),
+        )
+        # Códigos 0/1/2 = Negativo/Neutral/Positivo sin materializar textos
+        codigos = np.ones(len(puntuaciones), dtype=np.int8)
+        codigos[puntuaciones >= 0.05] = 2
+        codigos[puntuaciones <= -0.05] = 0
+        return puntuaciones, pd.Categorical.from_codes(codigos, categories=_SENTIMIENTO_CATEGORIES)
 
     # ------------------------------------------------------------------
     def _clean_reviews(self) -> None:
         self.logger.nueva_entrada("Transformación de reviews")
-        df = self.df_reviews_completo.head(self.muestra_reviews).copy()
+        df = self.df_reviews_completo.iloc[: self.muestra_reviews]
         if "comments" in df.columns:
-            df.dropna(subset=["comments"], inplace=True)
+            df = df.dropna(subset=["comments"])
         if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        resultados = df["comments"].apply(lambda x: self._sentiment_score(x))
-        df["sentimiento"], df["puntuacion_sentimiento"] = zip(*resultados)
-        self.df_reviews_analizado = df.reset_index(drop=True)
+            df["date"] = pd.to_datetime(df["date"], format="ISO8601", errors="coerce", cache=True)
+        puntuaciones, etiquetas = self._sentiment_score_batch(df["comments"].to_numpy(dtype=object))
+        df["sentimiento"] = etiquetas
+        df["puntuacion_sentimiento"] = puntuaciones
+        df.index = pd.RangeIndex(len(df))
+        self.df_reviews_analizado = df
         self.logger.info(
-            f"Reviews analizados: {self.df_reviews_analizado.shape[0]} filas con columnas {list(self.df_reviews_analizado.columns)}"
+            lambda: f"Reviews analizados: {self.df_reviews_analizado.shape[0]} filas con columnas {list(self.df_reviews_analizado.columns)}"
         )
 
     # ------------------------------------------------------------------
     def _clean_calendar(self) -> None:
         self.logger.nueva_entrada("Transformación de calendar")
-        df = self.df_calendar.copy()
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-            df["year"] = df["date"].dt.year
-            df["month"] = df["date"].dt.month
-            df["day"] = df["date"].dt.day
-        if "available" in df.columns:
-            if df["available"].dtype == bool:
-                df["available"] = df["available"].astype(int)
-            elif set(df["available"].dropna().unique()).issubset({"t", "f"}):
-                df["available"] = df["available"].apply(lambda x: 1 if x == "t" else 0)
-        df.drop(columns=["minimum_nights", "maximum_nights"], inplace=True, errors="ignore")
-        self.df_calendar_limpio = df.reset_index(drop=True)
+        lf = pl.from_pandas(self.df_calendar).lazy()
+        esquema = lf.collect_schema()
+        if "date" in esquema:
+            fecha = pl.col("date")
+            if esquema["date"] == pl.String:
+                fecha = fecha.str.to_datetime(strict=False)
+            lf = lf.with_columns(fecha.cast(pl.Datetime("ns")).alias("date")).with_columns(
+                pl.col("date").dt.year().alias("year"),
+                pl.col("date").dt.month().alias("month"),
+                pl.col("date").dt.day().alias("day"),
+            )
+        if "available" in esquema:
+            if esquema["available"] == pl.Boolean:
+                lf = lf.with_columns(pl.col("available").cast(pl.Int8))
+            elif esquema["available"] == pl.String:
+                lf = lf.with_columns(pl.col("available").eq("t").fill_null(False).cast(pl.Int8))
+        lf = lf.drop(["minimum_nights", "maximum_nights"], strict=False)
+        df = lf.collect().to_pandas()
+        self.df_calendar_limpio = df
         self.logger.info(f"Calendar limpio con forma {self.df_calendar_limpio.shape}")
 
     # ------------------------------------------------------------------
@@ -296,7 +422,9 @@ class Transformacion:
 
         self.logger.nueva_entrada("Agregación y merge final")
         sentiment_agg = (
-            self.df_reviews_analizado.groupby("listing_id")["puntuacion_sentimiento"]
+            self.df_reviews_analizado.groupby("listing_id", sort=False, observed=True)[
+                "puntuacion_sentimiento"
+            ]
             .agg(sentimiento_promedio="mean", numero_de_reviews_sentimiento="count")
             .reset_index()
         )
@@ -304,33 +432,39 @@ class Transformacion:
         sentiment_agg.rename(columns={"listing_id": "id"}, inplace=True)
         self.logger.info(f"Agregación de reviews con forma {sentiment_agg.shape}")
 
-        calendar_agg = (
-            self.df_calendar_limpio.groupby("listing_id").agg(
-                tasa_disponibilidad_anual=("available", "mean"),
-                dias_disponibles_anual=("available", "sum"),
-            )
-            .reset_index()
+        # La tasa se deriva de suma y conteo en una sola pasada de agregación
+        conteos = self.df_calendar_limpio.groupby("listing_id", sort=False, observed=True)[
+            "available"
+        ].agg(["sum", "count"])
+        calendar_agg = pd.DataFrame(
+            {
+                "id": conteos.index,
+                "tasa_disponibilidad_anual": (conteos["sum"] / conteos["count"] * 100).round(2).to_numpy(),
+                "dias_disponibles_anual": conteos["sum"].to_numpy(),
+            }
         )
-        calendar_agg["tasa_disponibilidad_anual"] = (
-            calendar_agg["tasa_disponibilidad_anual"] * 100
-        ).round(2)
-        calendar_agg.rename(columns={"listing_id": "id"}, inplace=True)
         self.logger.info(f"Agregación de calendar con forma {calendar_agg.shape}")
 
         # Guardar versión agregada para exportes posteriores evitando volúmenes masivos
-        self.df_calendar_agregado = calendar_agg.copy()
-
-        df_final = self.df_limpio.merge(sentiment_agg, on="id", how="left")
-        df_final = df_final.merge(calendar_agg, on="id", how="left")
-
-        for col in [
-            "sentimiento_promedio",
-            "numero_de_reviews_sentimiento",
-            "tasa_disponibilidad_anual",
-            "dias_disponibles_anual",
-        ]:
-            if col in df_final.columns:
-                df_final[col].fillna(0, inplace=True)
+        self.df_calendar_agregado = calendar_agg
+
+        # Ambas agregaciones son tablas pequeñas por listing: se unen primero
+        # para recorrer df_limpio con un único merge
+        agregados = sentiment_agg.merge(calendar_agg, on="id", how="outer")
+        df_final = self.df_limpio.merge(agregados, on="id", how="left")
+
+        df_final = df_final.fillna(
+            {
+                col: 0
+                for col in [
+                    "sentimiento_promedio",
+                    "numero_de_reviews_sentimiento",
+                    "tasa_disponibilidad_anual",
+                    "dias_disponibles_anual",
+                ]
+                if col in df_final.columns
+            }
+        )
         if "numero_de_reviews_sentimiento" in df_final.columns:
             df_final["numero_de_reviews_sentimiento"] = df_final[
                 "numero_de_reviews_sentimiento"